@@ -2,15 +2,21 @@
 
 import streamlit as st
 import pandas as pd
+import shutil
 import tempfile
 import os
 from pathlib import Path
 from typing import Optional, Tuple
 
 from src.logger import setup_logging, get_logger
-from src.schema_detector import detect_schema, SchemaDetectionError
-from src.db_manager import DatabaseManager, DatabaseError
-from src.crud_generator import render_crud_interface
+from src.schema_detector import (
+    detect_schema,
+    optimize_dtypes,
+    read_excel_sheet,
+    SchemaDetectionError,
+)
+from src.db_manager import DatabaseManager, DatabaseError, MEMORY_DB_URI
+from src.crud_generator import render_crud_interface, _bump_data_version
 
 # Initialize logging
 setup_logging()
@@ -29,6 +35,28 @@ MAX_ROWS = 10000
 SUPPORTED_EXTENSIONS = [".xlsx", ".xls"]
 
 
+@st.cache_resource
+def get_database_manager(
+    db_path: str = MEMORY_DB_URI, table_name: str = "data"
+) -> DatabaseManager:
+    """
+    Get the shared DatabaseManager for this database and table.
+
+    st.cache_resource keeps one instance (and its SQLite connection)
+    alive across Streamlit reruns, so interactions reuse the same
+    connection instead of reconnecting. With the default in-memory
+    database, that connection is also what keeps the data alive.
+
+    Args:
+        db_path: Path to SQLite database file.
+        table_name: Name of the table to manage.
+
+    Returns:
+        Shared DatabaseManager instance.
+    """
+    return DatabaseManager(db_path=db_path, table_name=table_name)
+
+
 def validate_file(uploaded_file) -> Tuple[bool, Optional[str]]:
     """
     Validate uploaded file.
@@ -54,42 +82,49 @@ def validate_file(uploaded_file) -> Tuple[bool, Optional[str]]:
     return True, None
 
 
-def process_excel_file(uploaded_file) -> Tuple[Optional[dict], Optional[str]]:
+def process_excel_file(
+    uploaded_file, db_manager: DatabaseManager
+) -> Tuple[Optional[dict], int, Optional[str]]:
     """
     Process uploaded Excel file.
 
     Args:
         uploaded_file: Streamlit uploaded file object.
+        db_manager: DatabaseManager to load the data into.
 
     Returns:
-        Tuple of (schema_dict, error_message).
+        Tuple of (schema_dict, row_count, error_message).
     """
     try:
-        # Save uploaded file to temporary location
+        # Stream uploaded file to temporary location in chunks, avoiding
+        # a full in-memory copy of the upload
         with tempfile.NamedTemporaryFile(delete=False, suffix=Path(uploaded_file.name).suffix) as tmp_file:
-            tmp_file.write(uploaded_file.getvalue())
+            uploaded_file.seek(0)
+            shutil.copyfileobj(uploaded_file, tmp_file, length=1024 * 1024)
             tmp_path = tmp_file.name
 
         try:
-            # Detect schema
+            # Read data once; detect_schema reuses the parsed frame
             logger.info(f"Processing file: {uploaded_file.name}")
-            schema = detect_schema(tmp_path)
-
-            # Read data
-            df = pd.read_excel(tmp_path, sheet_name=0, engine=None)
+            df = read_excel_sheet(tmp_path)
 
             # Check row count
             if len(df) > MAX_ROWS:
-                return None, f"Sheet exceeds {MAX_ROWS} row limit. Please use a smaller dataset for MVP."
+                return None, 0, f"Sheet exceeds {MAX_ROWS} row limit. Please use a smaller dataset for MVP."
+
+            # Detect schema (cleans df's column names in place)
+            schema = detect_schema(df)
+
+            # Shrink numeric columns before moving them into SQLite
+            df = optimize_dtypes(df, schema["types"])
 
             # Create database and load data
-            db_manager = DatabaseManager(table_name="data")
             db_manager.create_table(schema)
             db_manager.insert_data(df, schema)
 
             logger.info(f"Successfully processed file: {uploaded_file.name}, {len(df)} rows")
 
-            return schema, None
+            return schema, len(df), None
 
         finally:
             # Clean up temporary file
@@ -99,19 +134,19 @@ def process_excel_file(uploaded_file) -> Tuple[Optional[dict], Optional[str]]:
     except SchemaDetectionError as e:
         error_msg = str(e)
         logger.error(f"Schema detection error: {error_msg}")
-        return None, error_msg
+        return None, 0, error_msg
     except pd.errors.EmptyDataError:
         error_msg = "Excel file is empty or contains no data."
         logger.error(error_msg)
-        return None, error_msg
+        return None, 0, error_msg
     except pd.errors.ParserError as e:
         error_msg = f"Error parsing Excel file: {e}"
         logger.error(error_msg, exc_info=True)
-        return None, error_msg
+        return None, 0, error_msg
     except Exception as e:
         error_msg = f"Unexpected error processing file: {e}"
         logger.error(error_msg, exc_info=True)
-        return None, error_msg
+        return None, 0, error_msg
 
 
 def main():
@@ -143,7 +178,10 @@ def main():
         # Process file if not already processed
         if st.session_state.schema is None or st.button("Re-upload File"):
             with st.spinner("Processing file..."):
-                schema, error_msg = process_excel_file(uploaded_file)
+                db_manager = get_database_manager()
+                schema, row_count, error_msg = process_excel_file(
+                    uploaded_file, db_manager
+                )
 
                 if error_msg:
                     st.error(error_msg)
@@ -151,14 +189,11 @@ def main():
                     st.session_state.db_manager = None
                 else:
                     st.session_state.schema = schema
-                    st.session_state.db_manager = DatabaseManager(table_name="data")
-                    # Get record count from database
-                    try:
-                        df = st.session_state.db_manager.read_all()
-                        record_count = len(df)
-                    except Exception:
-                        record_count = 0
-                    st.success(f"File processed successfully! Loaded {record_count} records.")
+                    st.session_state.db_manager = db_manager
+                    # Drop any cached table snapshot from an earlier
+                    # upload in this session
+                    _bump_data_version()
+                    st.success(f"File processed successfully! Loaded {row_count} records.")
                     st.rerun()
 
     # Display CRUD interface if schema is available
@@ -10,6 +10,70 @@ from src.logger import get_logger
 logger = get_logger(__name__)
 
 
+@st.cache_data(show_spinner=False)
+def _load_records(
+    _db_manager: Any,
+    table_name: str,
+    version: int,
+    _schema: Optional[Dict[str, Any]] = None,
+) -> pd.DataFrame:
+    """
+    Load all records, cached until the data version changes.
+
+    Args:
+        _db_manager: DatabaseManager instance (excluded from the cache key).
+        table_name: Name of the table (part of the cache key).
+        version: Data version counter; bumping it invalidates the cache.
+        _schema: Optional schema dictionary passed through as dtype hints.
+
+    Returns:
+        DataFrame containing all records.
+    """
+    logger.debug("Cache miss, loading records from '%s' (v%d)", table_name, version)
+    return _db_manager.read_all(_schema)
+
+
+def _bump_data_version() -> None:
+    """Invalidate the cached table snapshot after a write."""
+    st.session_state.data_version = st.session_state.get("data_version", 0) + 1
+
+
+def _coerce_record(
+    record: Dict[str, Any], types: Dict[str, str], primary_key: str
+) -> Dict[str, Any]:
+    """
+    Coerce a record's values to widget-ready Python types in one pass.
+
+    Args:
+        record: Dictionary of column names to raw database values.
+        types: Dictionary mapping column names to types.
+        primary_key: Name of primary key column (left uncoerced).
+
+    Returns:
+        Dictionary of column names to int/float/date/str values.
+    """
+    coerced = {}
+    for col, value in record.items():
+        col_type = types.get(col, "str")
+        if col == primary_key:
+            coerced[col] = value
+        elif col_type == "int":
+            coerced[col] = int(value) if pd.notna(value) else 0
+        elif col_type == "float":
+            coerced[col] = float(value) if pd.notna(value) else 0.0
+        elif col_type == "date":
+            date_value = None
+            if pd.notna(value):
+                try:
+                    date_value = pd.to_datetime(value).date()
+                except Exception:
+                    pass
+            coerced[col] = date_value
+        else:  # str
+            coerced[col] = str(value) if pd.notna(value) else ""
+    return coerced
+
+
 def display_table_view(df: pd.DataFrame) -> None:
     """
     Display table view of all records.
@@ -17,7 +81,7 @@ def display_table_view(df: pd.DataFrame) -> None:
     Args:
         df: DataFrame containing records to display.
     """
-    logger.debug(f"Displaying table view with {len(df)} records")
+    logger.debug("Displaying table view with %d records", len(df))
     if df.empty:
         st.info("No records found.")
         return
@@ -78,8 +142,9 @@ def generate_create_form(
                         form_data[col] = val.isoformat()
 
                 record_id = db_manager.create_record(form_data)
-                logger.info(f"Created record with ID: {record_id}")
+                logger.info("Created record with ID: %s", record_id)
                 st.success(f"Record created successfully! ID: {record_id}")
+                _bump_data_version()
                 st.rerun()
             except Exception as e:
                 error_msg = f"Failed to create record: {e}"
@@ -91,7 +156,6 @@ def generate_create_form(
 
 def generate_edit_form(
     schema: Dict[str, Any],
-    df: pd.DataFrame,
     db_manager: Any,
     primary_key: str,
 ) -> None:
@@ -100,7 +164,6 @@ def generate_edit_form(
 
     Args:
         schema: Schema dictionary with 'columns' and 'types'.
-        df: DataFrame containing all records.
         db_manager: DatabaseManager instance.
         primary_key: Name of primary key column.
     """
@@ -108,72 +171,72 @@ def generate_edit_form(
 
     st.subheader("Edit Record")
 
-    if df.empty:
+    try:
+        record_ids = db_manager.list_ids(primary_key)
+    except Exception as e:
+        error_msg = f"Failed to load record IDs: {e}"
+        logger.error(error_msg, exc_info=True)
+        st.error(error_msg)
+        return
+
+    if not record_ids:
         st.info("No records available to edit.")
         return
 
-    # Select record to edit
-    if primary_key in df.columns:
-        record_options = df[primary_key].astype(str).tolist()
-        selected_key = st.selectbox(
-            "Select record to edit",
-            record_options,
-            key="edit_select",
-        )
-        selected_record = df[df[primary_key].astype(str) == selected_key].iloc[0]
-    else:
-        st.error("Primary key column not found in data")
+    # Select by position with IDs kept in their native dtype; format_func
+    # renders the label without casting the whole column to strings
+    selected_idx = st.selectbox(
+        "Select record to edit",
+        range(len(record_ids)),
+        format_func=lambda i: str(record_ids[i]),
+        key="edit_select",
+    )
+    record_id = record_ids[selected_idx]
+    selected_record = db_manager.get_record(primary_key, record_id)
+    if selected_record is None:
+        st.error("Selected record no longer exists")
         return
 
+    columns = schema["columns"]
+    types = schema["types"]
+
+    # Coerce current values once per selected record and keep them in
+    # session state, instead of re-converting every widget on each rerun
+    cache_key = f"edit_cache_{record_id}"
+    if cache_key not in st.session_state:
+        st.session_state[cache_key] = _coerce_record(
+            selected_record, types, primary_key
+        )
+    current = st.session_state[cache_key]
+
     with st.form("edit_form"):
         form_data = {}
-        columns = schema["columns"]
-        types = schema["types"]
 
         # Generate input fields pre-filled with existing values
         for col in columns:
             if col == primary_key:
                 # Display primary key as read-only
-                st.text_input(col, value=str(selected_record[col]), disabled=True)
-                form_data[col] = selected_record[col]
+                st.text_input(col, value=str(current[col]), disabled=True)
+                form_data[col] = current[col]
                 continue
 
             col_type = types.get(col, "str")
-            current_value = selected_record[col]
 
             if col_type == "int":
                 form_data[col] = st.number_input(
-                    col,
-                    value=int(current_value) if pd.notna(current_value) else 0,
-                    step=1,
-                    key=f"edit_{col}",
+                    col, value=current[col], step=1, key=f"edit_{col}"
                 )
             elif col_type == "float":
                 form_data[col] = st.number_input(
-                    col,
-                    value=float(current_value) if pd.notna(current_value) else 0.0,
-                    step=0.01,
-                    key=f"edit_{col}",
+                    col, value=current[col], step=0.01, key=f"edit_{col}"
                 )
             elif col_type == "date":
-                # Parse date string if needed
-                date_value = None
-                if pd.notna(current_value):
-                    try:
-                        if isinstance(current_value, str):
-                            date_value = pd.to_datetime(current_value).date()
-                        else:
-                            date_value = pd.to_datetime(current_value).date()
-                    except Exception:
-                        pass
                 form_data[col] = st.date_input(
-                    col, value=date_value, key=f"edit_{col}"
+                    col, value=current[col], key=f"edit_{col}"
                 )
             else:  # str
                 form_data[col] = st.text_input(
-                    col,
-                    value=str(current_value) if pd.notna(current_value) else "",
-                    key=f"edit_{col}",
+                    col, value=current[col], key=f"edit_{col}"
                 )
 
         submitted = st.form_submit_button("Update Record")
@@ -187,8 +250,10 @@ def generate_edit_form(
 
                 record_id = selected_record[primary_key]
                 db_manager.update_record(record_id, form_data)
-                logger.info(f"Updated record {record_id}")
+                logger.info("Updated record %s", record_id)
                 st.success("Record updated successfully!")
+                st.session_state.pop(cache_key, None)
+                _bump_data_version()
                 st.rerun()
             except Exception as e:
                 error_msg = f"Failed to update record: {e}"
@@ -197,13 +262,12 @@ def generate_edit_form(
 
 
 def generate_delete_interface(
-    df: pd.DataFrame, db_manager: Any, primary_key: str
+    db_manager: Any, primary_key: str
 ) -> None:
     """
     Generate delete interface.
 
     Args:
-        df: DataFrame containing all records.
         db_manager: DatabaseManager instance.
         primary_key: Name of primary key column.
     """
@@ -211,32 +275,35 @@ def generate_delete_interface(
 
     st.subheader("Delete Record")
 
-    if df.empty:
-        st.info("No records available to delete.")
+    try:
+        record_ids = db_manager.list_ids(primary_key)
+    except Exception as e:
+        error_msg = f"Failed to load record IDs: {e}"
+        logger.error(error_msg, exc_info=True)
+        st.error(error_msg)
         return
 
-    if primary_key not in df.columns:
-        st.error("Primary key column not found in data")
+    if not record_ids:
+        st.info("No records available to delete.")
         return
 
-    # Select record to delete
-    record_options = df[primary_key].astype(str).tolist()
-    selected_key = st.selectbox(
+    # Select by position with IDs kept in their native dtype
+    selected_idx = st.selectbox(
         "Select record to delete",
-        record_options,
+        range(len(record_ids)),
+        format_func=lambda i: str(record_ids[i]),
         key="delete_select",
     )
 
     # Confirmation
     if st.button("Delete Record", type="primary", key="delete_button"):
         try:
-            # Get the actual primary key value (not string representation)
-            selected_record = df[df[primary_key].astype(str) == selected_key].iloc[0]
-            record_id = selected_record[primary_key]
+            record_id = record_ids[selected_idx]
 
             db_manager.delete_record(record_id)
-            logger.info(f"Deleted record {record_id}")
+            logger.info("Deleted record %s", record_id)
             st.success("Record deleted successfully!")
+            _bump_data_version()
             st.rerun()
         except Exception as e:
             error_msg = f"Failed to delete record: {e}"
@@ -256,9 +323,14 @@ def render_crud_interface(
     """
     logger.info("Rendering CRUD interface")
 
-    # Read all records
+    if "data_version" not in st.session_state:
+        st.session_state.data_version = 0
+
+    # Read all records (cached until a write bumps the data version)
     try:
-        df = db_manager.read_all()
+        df = _load_records(
+            db_manager, db_manager.table_name, st.session_state.data_version, schema
+        )
     except Exception as e:
         error_msg = f"Failed to read records: {e}"
         logger.error(error_msg, exc_info=True)
@@ -277,7 +349,7 @@ def render_crud_interface(
         generate_create_form(schema, db_manager)
 
     with tab3:
-        generate_edit_form(schema, df, db_manager, primary_key)
+        generate_edit_form(schema, db_manager, primary_key)
 
     with tab4:
-        generate_delete_interface(df, db_manager, primary_key)
+        generate_delete_interface(db_manager, primary_key)
@@ -11,6 +11,17 @@ from src.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Shared-cache in-memory database: lives as long as at least one
+# connection stays open, so the persistent manager connection keeps it
+# alive for the session
+MEMORY_DB_URI = "file:memdb1?mode=memory&cache=shared"
+
+# Pandas dtype hints per schema type; nullable Int64 survives NULLs
+_PANDAS_DTYPES = {
+    "int": "Int64",
+    "float": "float64",
+}
+
 
 class DatabaseError(Exception):
     """Custom exception for database errors."""
@@ -18,43 +29,85 @@ class DatabaseError(Exception):
     pass
 
 
+def _quote_identifier(identifier: str) -> str:
+    """
+    Quote an identifier for safe interpolation into SQL.
+
+    Args:
+        identifier: Table or column name (user-controlled for uploads).
+
+    Returns:
+        Double-quoted identifier with embedded quotes escaped.
+    """
+    return '"' + str(identifier).replace('"', '""') + '"'
+
+
 class DatabaseManager:
     """Manages SQLite database operations for a single table."""
 
-    def __init__(self, db_path: str = "data.db", table_name: str = "data"):
+    def __init__(self, db_path: str = MEMORY_DB_URI, table_name: str = "data"):
         """
         Initialize database manager.
 
         Args:
-            db_path: Path to SQLite database file.
+            db_path: Path to SQLite database file, or a file: URI.
+                Defaults to a session-scoped in-memory database; pass a
+                regular path (e.g. "data.db") for durable storage.
             table_name: Name of the table to manage.
         """
         self.db_path = db_path
         self.table_name = table_name
-        logger.info(f"DatabaseManager initialized: db={db_path}, table={table_name}")
+        self.primary_key: Optional[str] = None
+        # Non-PK columns the schema declares searchable; indexed after
+        # the bulk load rather than before it
+        self._index_columns: List[str] = []
+        # Identifiers are quoted once here and reused in every statement
+        self._table_sql = _quote_identifier(table_name)
+        # SQL strings memoized per column tuple; SQLite's own prepared
+        # statement cache is enlarged to match on the shared connection
+        self._sql_cache: Dict[tuple, str] = {}
+        # Keep one connection alive for the manager's lifetime instead of
+        # reconnecting (and re-fsyncing) on every operation
+        self._conn = sqlite3.connect(
+            db_path,
+            check_same_thread=False,
+            cached_statements=256,
+            uri=db_path.startswith("file:"),
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._tune_connection()
+        logger.info("DatabaseManager initialized: db=%s, table=%s", db_path, table_name)
+
+    def _tune_connection(self) -> None:
+        """Apply PRAGMAs tuned for a single-user, bulk-load-heavy workload."""
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-65536")
 
     @contextmanager
     def get_connection(self):
         """
         Get database connection as context manager.
 
+        Each with-block runs as a single transaction: committed on
+        success, rolled back on error. The underlying connection stays
+        open across calls.
+
         Yields:
             SQLite connection object.
         """
-        conn = None
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            yield conn
-            conn.commit()
+            yield self._conn
+            self._conn.commit()
         except sqlite3.Error as e:
-            if conn:
-                conn.rollback()
+            self._conn.rollback()
             logger.error(f"Database error: {e}", exc_info=True)
             raise DatabaseError(f"Database operation failed: {e}")
-        finally:
-            if conn:
-                conn.close()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
 
     def create_table(self, schema: Dict[str, Any]) -> None:
         """
@@ -66,27 +119,37 @@ class DatabaseManager:
         Raises:
             DatabaseError: If table creation fails.
         """
-        logger.info(f"Creating table '{self.table_name}' with schema")
+        logger.info("Creating table '%s' with schema", self.table_name)
         columns = schema["columns"]
         types = schema["types"]
         primary_key = schema["primary_key"]
+        self.primary_key = primary_key
+        # Only columns the schema declares searchable get secondary
+        # indexes, and only after insert_data's bulk load — the primary
+        # key is already indexed and every extra index slows the load
+        self._index_columns = [
+            col
+            for col in schema.get("searchable", [])
+            if col in columns and col != primary_key
+        ]
 
         # Build column definitions
         col_defs = []
         for col in columns:
+            col_sql = _quote_identifier(col)
             col_type = self._map_type_to_sqlite(types.get(col, "str"))
             if col == primary_key:
                 if primary_key == "id":
                     # Auto-increment integer primary key
-                    col_defs.append(f"{col} INTEGER PRIMARY KEY AUTOINCREMENT")
+                    col_defs.append(f"{col_sql} INTEGER PRIMARY KEY AUTOINCREMENT")
                 else:
                     # Use existing column as primary key
-                    col_defs.append(f"{col} {col_type} PRIMARY KEY")
+                    col_defs.append(f"{col_sql} {col_type} PRIMARY KEY")
             else:
-                col_defs.append(f"{col} {col_type}")
+                col_defs.append(f"{col_sql} {col_type}")
 
         create_sql = f"""
-        CREATE TABLE IF NOT EXISTS {self.table_name} (
+        CREATE TABLE IF NOT EXISTS {self._table_sql} (
             {', '.join(col_defs)}
         )
         """
@@ -94,7 +157,7 @@ class DatabaseManager:
         try:
             with self.get_connection() as conn:
                 conn.execute(create_sql)
-                logger.info(f"Table '{self.table_name}' created successfully")
+                logger.info("Table '%s' created successfully", self.table_name)
         except sqlite3.Error as e:
             error_msg = f"Failed to create table: {e}"
             logger.error(error_msg, exc_info=True)
@@ -118,6 +181,28 @@ class DatabaseManager:
         }
         return type_mapping.get(python_type, "TEXT")
 
+    def _get_primary_key(self) -> str:
+        """
+        Get the table's primary key column name.
+
+        Resolved from the schema at create_table time, or lazily via a
+        single PRAGMA table_info query and cached afterwards.
+
+        Returns:
+            Primary key column name.
+        """
+        if self.primary_key is None:
+            cursor = self._conn.execute(f"PRAGMA table_info({self._table_sql})")
+            table_info = cursor.fetchall()
+            if table_info:
+                self.primary_key = next(
+                    (row[1] for row in table_info if row[5] == 1),
+                    table_info[0][1],
+                )
+            else:
+                self.primary_key = "id"
+        return self.primary_key
+
     def insert_data(self, df: pd.DataFrame, schema: Dict[str, Any]) -> None:
         """
         Insert data from DataFrame into table.
@@ -129,7 +214,7 @@ class DatabaseManager:
         Raises:
             DatabaseError: If insertion fails.
         """
-        logger.info(f"Inserting {len(df)} rows into '{self.table_name}'")
+        logger.info("Inserting %d rows into '%s'", len(df), self.table_name)
 
         # Handle auto-generated primary key
         primary_key = schema["primary_key"]
@@ -139,30 +224,40 @@ class DatabaseManager:
         else:
             insert_columns = df.columns.tolist()
 
-        # Prepare data for insertion
-        placeholders = ", ".join(["?" for _ in insert_columns])
-        columns_str = ", ".join(insert_columns)
-        insert_sql = f"INSERT INTO {self.table_name} ({columns_str}) VALUES ({placeholders})"
-
         try:
+            # Convert columns in one shot instead of looping over rows:
+            # dates become ISO format strings, NaN/NaT become None
+            sub = df[insert_columns].copy()
+            datetime_cols = sub.select_dtypes(
+                include=["datetime", "datetimetz"]
+            ).columns
+            for col in datetime_cols:
+                sub[col] = sub[col].dt.strftime("%Y-%m-%dT%H:%M:%S")
+            sub = sub.astype(object).where(pd.notna(sub), None)
+
+            # Batch rows into multi-VALUES statements, staying under
+            # SQLite's bound-parameter limit
+            chunksize = max(1, min(500, 30000 // max(1, len(insert_columns))))
+
             with self.get_connection() as conn:
-                # Convert DataFrame to list of tuples
-                data_to_insert = []
-                for _, row in df.iterrows():
-                    values = []
-                    for col in insert_columns:
-                        val = row[col]
-                        # Convert dates to ISO format strings
-                        if pd.isna(val):
-                            values.append(None)
-                        elif isinstance(val, pd.Timestamp):
-                            values.append(val.isoformat())
-                        else:
-                            values.append(val)
-                    data_to_insert.append(tuple(values))
-
-                conn.executemany(insert_sql, data_to_insert)
-                logger.info(f"Successfully inserted {len(data_to_insert)} rows")
+                sub.to_sql(
+                    self.table_name,
+                    conn,
+                    if_exists="append",
+                    index=False,
+                    method="multi",
+                    chunksize=chunksize,
+                )
+                # Build requested secondary indexes now that the data is
+                # in place, so each b-tree is written once instead of
+                # being updated on every inserted row
+                for col in self._index_columns:
+                    index_sql = _quote_identifier(f"idx_{self.table_name}_{col}")
+                    conn.execute(
+                        f"CREATE INDEX IF NOT EXISTS {index_sql} "
+                        f"ON {self._table_sql} ({_quote_identifier(col)})"
+                    )
+                logger.info("Successfully inserted %d rows", len(sub))
         except sqlite3.Error as e:
             error_msg = f"Failed to insert data: {e}"
             logger.error(error_msg, exc_info=True)
@@ -181,47 +276,143 @@ class DatabaseManager:
         Raises:
             DatabaseError: If creation fails.
         """
-        logger.debug(f"Creating record in '{self.table_name}': {data}")
+        logger.debug("Creating record in '%s': %s", self.table_name, data)
 
         columns = list(data.keys())
-        placeholders = ", ".join(["?" for _ in columns])
-        columns_str = ", ".join(columns)
-        insert_sql = f"INSERT INTO {self.table_name} ({columns_str}) VALUES ({placeholders})"
+        cache_key = ("insert", tuple(columns))
+        insert_sql = self._sql_cache.get(cache_key)
+        if insert_sql is None:
+            placeholders = ", ".join(["?" for _ in columns])
+            columns_str = ", ".join(_quote_identifier(col) for col in columns)
+            insert_sql = f"INSERT INTO {self._table_sql} ({columns_str}) VALUES ({placeholders})"
+            self._sql_cache[cache_key] = insert_sql
 
         try:
             with self.get_connection() as conn:
                 values = [data[col] for col in columns]
                 cursor = conn.execute(insert_sql, values)
                 record_id = cursor.lastrowid
-                logger.info(f"Created record with ID: {record_id}")
+                logger.info("Created record with ID: %s", record_id)
                 return record_id
         except sqlite3.Error as e:
             error_msg = f"Failed to create record: {e}"
             logger.error(error_msg, exc_info=True)
             raise DatabaseError(error_msg)
 
-    def read_all(self) -> pd.DataFrame:
+    def read_all(self, schema: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
         """
         Read all records from table.
 
+        Args:
+            schema: Optional schema dictionary; when given, its types are
+                passed to pandas as dtype hints to skip type inference.
+
         Returns:
             DataFrame containing all records.
 
         Raises:
             DatabaseError: If read fails.
         """
-        logger.debug(f"Reading all records from '{self.table_name}'")
+        logger.debug("Reading all records from '%s'", self.table_name)
+
+        dtype = None
+        if schema is not None:
+            dtype = {
+                col: _PANDAS_DTYPES[col_type]
+                for col, col_type in schema["types"].items()
+                if col_type in _PANDAS_DTYPES
+            }
 
         try:
             with self.get_connection() as conn:
-                df = pd.read_sql_query(f"SELECT * FROM {self.table_name}", conn)
-                logger.info(f"Read {len(df)} records")
+                # Hand pandas plain tuples; Row objects are slower to unpack
+                conn.row_factory = None
+                try:
+                    df = pd.read_sql_query(
+                        f"SELECT * FROM {self._table_sql}", conn, dtype=dtype
+                    )
+                finally:
+                    conn.row_factory = sqlite3.Row
+                logger.info("Read %d records", len(df))
                 return df
         except sqlite3.Error as e:
             error_msg = f"Failed to read records: {e}"
             logger.error(error_msg, exc_info=True)
             raise DatabaseError(error_msg)
 
+    def count(self) -> int:
+        """
+        Count records in the table.
+
+        Returns:
+            Number of records.
+
+        Raises:
+            DatabaseError: If the count fails.
+        """
+        logger.debug("Counting records in '%s'", self.table_name)
+
+        with self.get_connection() as conn:
+            return conn.execute(
+                f"SELECT COUNT(*) FROM {self._table_sql}"
+            ).fetchone()[0]
+
+    def list_ids(self, primary_key: str) -> List[Any]:
+        """
+        Read all primary key values from the table.
+
+        Args:
+            primary_key: Name of the primary key column.
+
+        Returns:
+            List of primary key values.
+
+        Raises:
+            DatabaseError: If read fails.
+        """
+        logger.debug("Listing '%s' values from '%s'", primary_key, self.table_name)
+
+        cache_key = ("list_ids", primary_key)
+        list_sql = self._sql_cache.get(cache_key)
+        if list_sql is None:
+            list_sql = (
+                f"SELECT {_quote_identifier(primary_key)} FROM {self._table_sql}"
+            )
+            self._sql_cache[cache_key] = list_sql
+
+        with self.get_connection() as conn:
+            rows = conn.execute(list_sql)
+            return [row[0] for row in rows]
+
+    def get_record(self, primary_key: str, record_id: Any) -> Optional[Dict[str, Any]]:
+        """
+        Read a single record by primary key value.
+
+        Args:
+            primary_key: Name of the primary key column.
+            record_id: Primary key value of record to fetch.
+
+        Returns:
+            Dictionary of column names to values, or None if not found.
+
+        Raises:
+            DatabaseError: If read fails.
+        """
+        logger.debug("Reading record %s from '%s'", record_id, self.table_name)
+
+        cache_key = ("get_record", primary_key)
+        select_sql = self._sql_cache.get(cache_key)
+        if select_sql is None:
+            select_sql = (
+                f"SELECT * FROM {self._table_sql} "
+                f"WHERE {_quote_identifier(primary_key)} = ?"
+            )
+            self._sql_cache[cache_key] = select_sql
+
+        with self.get_connection() as conn:
+            row = conn.execute(select_sql, (record_id,)).fetchone()
+            return dict(row) if row is not None else None
+
     def update_record(self, record_id: Any, data: Dict[str, Any]) -> None:
         """
         Update an existing record.
@@ -233,25 +424,33 @@ class DatabaseManager:
         Raises:
             DatabaseError: If update fails.
         """
-        logger.debug(f"Updating record {record_id} in '{self.table_name}': {data}")
-
-        # Get primary key column name (assume it's 'id' or first column)
-        # For simplicity, we'll use the first key in data or 'id'
-        primary_key = "id" if "id" in data else list(data.keys())[0]
-
-        set_clauses = [f"{col} = ?" for col in data.keys() if col != primary_key]
-        if not set_clauses:
-            logger.warning("No fields to update")
-            return
-
-        update_sql = f"UPDATE {self.table_name} SET {', '.join(set_clauses)} WHERE {primary_key} = ?"
+        logger.debug("Updating record %s in '%s': %s", record_id, self.table_name, data)
+
+        primary_key = self._get_primary_key()
+
+        cache_key = ("update", tuple(data.keys()))
+        update_sql = self._sql_cache.get(cache_key)
+        if update_sql is None:
+            set_clauses = [
+                f"{_quote_identifier(col)} = ?"
+                for col in data.keys()
+                if col != primary_key
+            ]
+            if not set_clauses:
+                logger.warning("No fields to update")
+                return
+            update_sql = (
+                f"UPDATE {self._table_sql} SET {', '.join(set_clauses)} "
+                f"WHERE {_quote_identifier(primary_key)} = ?"
+            )
+            self._sql_cache[cache_key] = update_sql
 
         try:
             with self.get_connection() as conn:
                 values = [data[col] for col in data.keys() if col != primary_key]
                 values.append(record_id)
                 conn.execute(update_sql, values)
-                logger.info(f"Updated record {record_id}")
+                logger.info("Updated record %s", record_id)
         except sqlite3.Error as e:
             error_msg = f"Failed to update record: {e}"
             logger.error(error_msg, exc_info=True)
@@ -267,27 +466,21 @@ class DatabaseManager:
         Raises:
             DatabaseError: If deletion fails.
         """
-        logger.debug(f"Deleting record {record_id} from '{self.table_name}'")
+        logger.debug("Deleting record %s from '%s'", record_id, self.table_name)
 
-        # Try 'id' first, then assume first column is primary key
-        delete_sql = f"DELETE FROM {self.table_name} WHERE id = ?"
+        cache_key = ("delete",)
+        delete_sql = self._sql_cache.get(cache_key)
+        if delete_sql is None:
+            delete_sql = (
+                f"DELETE FROM {self._table_sql} "
+                f"WHERE {_quote_identifier(self._get_primary_key())} = ?"
+            )
+            self._sql_cache[cache_key] = delete_sql
 
         try:
             with self.get_connection() as conn:
-                cursor = conn.execute(delete_sql, (record_id,))
-                if cursor.rowcount == 0:
-                    # Try with first column as primary key
-                    # Get table info to find primary key
-                    cursor = conn.execute(f"PRAGMA table_info({self.table_name})")
-                    table_info = cursor.fetchall()
-                    if table_info:
-                        pk_col = next(
-                            (row[1] for row in table_info if row[5] == 1),
-                            table_info[0][1],
-                        )
-                        delete_sql = f"DELETE FROM {self.table_name} WHERE {pk_col} = ?"
-                        conn.execute(delete_sql, (record_id,))
-                logger.info(f"Deleted record {record_id}")
+                conn.execute(delete_sql, (record_id,))
+                logger.info("Deleted record %s", record_id)
         except sqlite3.Error as e:
             error_msg = f"Failed to delete record: {e}"
             logger.error(error_msg, exc_info=True)
@@ -1,15 +1,33 @@
 """Logging configuration module for Excel to Streamlit MVP."""
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from pathlib import Path
+from typing import Optional
+
+# Background listener that drains the log queue; stopped at shutdown
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Stop the background log listener, flushing queued records."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
 
 
 def setup_logging(log_level: str = "INFO") -> None:
     """
     Set up logging configuration with file and console handlers.
 
+    Handlers are attached to a background QueueListener thread, so log
+    calls on the hot path only enqueue the record instead of formatting
+    and writing to disk synchronously.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
                    Defaults to INFO.
@@ -24,6 +42,7 @@ def setup_logging(log_level: str = "INFO") -> None:
 
     # Remove existing handlers to avoid duplicates
     root_logger.handlers.clear()
+    _stop_queue_listener()
 
     # Log format
     log_format = logging.Formatter(
@@ -41,13 +60,22 @@ def setup_logging(log_level: str = "INFO") -> None:
     )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(log_format)
-    root_logger.addHandler(file_handler)
 
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(log_format)
-    root_logger.addHandler(console_handler)
+
+    # Hot path only enqueues; the listener thread does the formatting
+    # and IO for both handlers
+    global _queue_listener
+    log_queue: "queue.Queue" = queue.Queue(-1)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+    atexit.register(_stop_queue_listener)
 
     logging.info("Logging configured successfully")
 
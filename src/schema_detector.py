@@ -1,6 +1,15 @@
 """Schema detection module for Excel files."""
 
+import functools
+import hashlib
+import json
+import os
+import re
+import sys
+
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import logging
@@ -9,6 +18,213 @@ from src.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Prefer the Rust-backed calamine engine when available; pandas falls
+# back to openpyxl/xlrd otherwise
+try:
+    import python_calamine  # noqa: F401
+
+    _EXCEL_ENGINE: Optional[str] = "calamine"
+except ImportError:  # pragma: no cover
+    _EXCEL_ENGINE = None
+
+
+def read_excel_sheet(file_path: str, nrows: Optional[int] = None) -> pd.DataFrame:
+    """
+    Read the first sheet of an Excel file with the fastest available engine.
+
+    Args:
+        file_path: Path to the Excel file.
+        nrows: Optional cap on the number of data rows to read.
+
+    Returns:
+        DataFrame containing the first sheet (or its first nrows rows).
+    """
+    # Capped reads feed schema inference only, so Arrow-backed dtypes
+    # are safe there and make the nunique/isna scans run in C++ kernels.
+    # Full reads stay NumPy-backed for the SQLite insertion path.
+    kwargs = {"dtype_backend": "pyarrow"} if nrows is not None else {}
+    if _EXCEL_ENGINE is not None:
+        try:
+            return pd.read_excel(
+                file_path, sheet_name=0, engine=_EXCEL_ENGINE, nrows=nrows, **kwargs
+            )
+        except Exception as e:
+            logger.warning(
+                f"Engine '{_EXCEL_ENGINE}' failed ({e}), falling back to default"
+            )
+    if nrows is not None and str(file_path).lower().endswith(".xlsx"):
+        # openpyxl's read-only mode streams rows, so a capped read does
+        # not have to materialize the whole workbook first
+        try:
+            return _stream_sample_openpyxl(file_path, nrows)
+        except Exception as e:
+            logger.warning(f"Streaming sample read failed ({e}), falling back")
+    return pd.read_excel(
+        file_path, sheet_name=0, engine=None, nrows=nrows, **kwargs
+    )
+
+
+def _validate_header_row(file_path: str) -> None:
+    """
+    Fail fast on files with no data by reading only the header row.
+
+    Uses openpyxl's read-only mode to pull the first row of an .xlsx
+    file before the (much more expensive) full or sampled read. Files
+    that cannot be probed this way are left for the normal read path.
+
+    Args:
+        file_path: Path to the Excel file.
+
+    Raises:
+        SchemaDetectionError: If the first row is missing or all empty.
+    """
+    if not str(file_path).lower().endswith(".xlsx"):
+        return
+    try:
+        from openpyxl import load_workbook
+
+        wb = load_workbook(file_path, read_only=True)
+        try:
+            ws = wb[wb.sheetnames[0]]
+            header = next(ws.iter_rows(values_only=True), None)
+        finally:
+            wb.close()
+    except Exception as e:
+        logger.debug(f"Header probe failed ({e}), deferring to full read")
+        return
+    if header is None or all(value is None for value in header):
+        raise SchemaDetectionError("Excel file contains no data")
+
+
+def _stream_sample_openpyxl(file_path: str, nrows: int) -> pd.DataFrame:
+    """
+    Stream the header row plus at most nrows data rows via openpyxl.
+
+    Args:
+        file_path: Path to the .xlsx file.
+        nrows: Maximum number of data rows to read.
+
+    Returns:
+        DataFrame built from the sampled rows.
+    """
+    from openpyxl import load_workbook
+
+    wb = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        ws = wb[wb.sheetnames[0]]
+        rows = []
+        for i, row in enumerate(ws.iter_rows(values_only=True)):
+            rows.append(row)
+            if i >= nrows:  # header row + nrows data rows
+                break
+    finally:
+        wb.close()
+
+    if not rows:
+        return pd.DataFrame()
+    return pd.DataFrame.from_records(rows[1:], columns=rows[0])
+
+
+# Characters not allowed in SQL identifiers, replaced by underscores
+_INVALID_CHARS = re.compile(r"[^0-9A-Za-z_]")
+
+# Common separators and punctuation mapped to underscores in one
+# C-level translate() pass; the regex above only catches stragglers
+_NAME_TRANS = str.maketrans(
+    {c: "_" for c in " \t\n-./\\()[]{},;:@#$%^&*+=<>?!|~`'\""}
+)
+
+# Shape of a plausible date string: leading 2-4 digit field and a
+# - or / separator (e.g. "2024-01-15", "01/15/2024")
+_DATE_SHAPE = re.compile(r"^\d{2,4}[-/]")
+
+# Detected schemas persisted across runs, keyed on a hash of the
+# cleaned header row; similarly-shaped files skip inference entirely.
+# Module-level so tests (and embedders) can point it elsewhere.
+_SCHEMA_CACHE_PATH = (
+    Path.home() / ".cache" / "excel-to-streamlit" / "schemas.json"
+)
+
+
+def _header_signature(columns: List[str]) -> str:
+    """Hash a cleaned header row into a schema-cache key."""
+    return hashlib.sha1("\x1f".join(sorted(columns)).encode()).hexdigest()
+
+
+def _load_schema_cache() -> Dict[str, Any]:
+    """Load the persisted schema cache, or an empty dict on any failure."""
+    try:
+        with open(_SCHEMA_CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _cached_schema_matches(
+    df: pd.DataFrame, columns: List[str], cached: Dict[str, Any]
+) -> bool:
+    """
+    Check that a cached schema is actually valid for this file's data.
+
+    The cached schema came from a different file's values, so both its
+    types and its primary key are re-verified against the current data
+    before reuse: each column's dtype kind must agree with the cached
+    type (object columns get a sampled lattice pass, which exits on the
+    first string), and the primary key's uniqueness is re-checked —
+    cheap thanks to the short-circuits in _is_unique_column.
+
+    Args:
+        df: DataFrame with cleaned column names.
+        columns: Cleaned column names of the current file.
+        cached: Cached schema entry with 'types' and 'primary_key'.
+
+    Returns:
+        True if the cached schema can be reused for this file.
+    """
+    cached_types = cached.get("types", {})
+    if set(cached_types) != set(columns):
+        return False
+
+    for col in columns:
+        cached_type = cached_types[col]
+        kind = df[col].dtype.kind
+        if kind == "M":
+            if cached_type != _TYPE_DATE:
+                return False
+        elif kind in "iu":
+            if cached_type != _TYPE_INT:
+                return False
+        elif kind == "f":
+            if cached_type != _TYPE_FLOAT:
+                return False
+        else:
+            non_null = df[col].head(256).dropna()
+            inferred = (
+                _TYPE_STR if non_null.empty else _infer_object_type(non_null)
+            )
+            if cached_type != inferred:
+                return False
+
+    primary_key = cached.get("primary_key")
+    if primary_key == "id":
+        return True
+    return primary_key in df.columns and _is_unique_column(df[primary_key])
+
+
+def _store_schema_cache(
+    signature: str, types: Dict[str, str], primary_key: str
+) -> None:
+    """Persist an inferred schema under its header signature."""
+    try:
+        cache = _load_schema_cache()
+        cache[signature] = {"types": types, "primary_key": primary_key}
+        _SCHEMA_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(_SCHEMA_CACHE_PATH, "w") as f:
+            json.dump(cache, f)
+    except OSError:
+        # The cache is an optimization only; never fail detection on it
+        logger.debug("Could not persist schema cache", exc_info=True)
+
 
 class SchemaDetectionError(Exception):
     """Custom exception for schema detection errors."""
@@ -16,27 +232,49 @@ class SchemaDetectionError(Exception):
     pass
 
 
-def detect_schema(file_path: str) -> Dict[str, Any]:
+def detect_schema(
+    source, sample_rows: int = 10_000, return_df: bool = False
+) -> Dict[str, Any]:
     """
-    Detect schema from Excel file (first sheet only).
+    Detect schema from an Excel file (first sheet only) or a loaded DataFrame.
+
+    Passing an already-parsed DataFrame avoids reading the workbook a
+    second time when the caller also needs the data. Column names are
+    cleaned in place so the frame matches the detected schema. When
+    given a path, only the first sample_rows rows are read — enough for
+    inference without materializing huge sheets — unless return_df is
+    True, in which case the whole sheet is read once and handed back so
+    the caller never has to re-parse it.
 
     Args:
-        file_path: Path to the Excel file.
+        source: Path to the Excel file, or an already-loaded DataFrame.
+        sample_rows: Maximum number of rows to read for a path source.
+        return_df: Include the parsed DataFrame under the 'df' key.
 
     Returns:
         Dictionary containing:
         - columns: List of column names
         - types: Dictionary mapping column names to types (int, float, str, date)
         - primary_key: Name of primary key column (or 'id' if auto-generated)
+        - df: The parsed DataFrame (only when return_df is True)
 
     Raises:
         SchemaDetectionError: If file cannot be read or has no data.
     """
-    logger.info(f"Starting schema detection for file: {file_path}")
-
     try:
-        # Read first sheet only
-        df = pd.read_excel(file_path, sheet_name=0, engine=None)
+        if isinstance(source, pd.DataFrame):
+            logger.info("Starting schema detection for pre-loaded DataFrame")
+            df = source
+        else:
+            logger.info(f"Starting schema detection for file: {source}")
+            # Probe just the header row first so empty files fail
+            # before any full parse
+            _validate_header_row(source)
+            # Read a sample of the first sheet only — or, when the
+            # caller wants the data back, the whole sheet exactly once
+            df = read_excel_sheet(
+                source, nrows=None if return_df else sample_rows
+            )
         logger.debug(f"Read {len(df)} rows, {len(df.columns)} columns")
 
         if df.empty:
@@ -45,8 +283,10 @@ def detect_schema(file_path: str) -> Dict[str, Any]:
         if len(df.columns) == 0:
             raise SchemaDetectionError("Excel file has no columns")
 
-        # Handle missing headers
-        if df.columns[0].startswith("Unnamed"):
+        # Handle missing headers; a non-string first column name means
+        # pandas promoted a data row, so treat that as headerless too
+        first_col = df.columns[0]
+        if not isinstance(first_col, str) or first_col.startswith("Unnamed"):
             logger.warning("No headers detected, auto-generating column names")
             df.columns = [f"Column{i+1}" for i in range(len(df.columns))]
 
@@ -54,22 +294,50 @@ def detect_schema(file_path: str) -> Dict[str, Any]:
         columns = [clean_column_name(col) for col in df.columns]
         df.columns = columns
 
+        # Files with a previously-seen header row reuse the persisted
+        # schema and skip inference — but only after the cached schema
+        # is re-verified against this file's actual data, since header
+        # signatures collide across files that merely share column names
+        signature = _header_signature(columns)
+        cached = _load_schema_cache().get(signature)
+        if cached is not None and _cached_schema_matches(df, columns, cached):
+            logger.info(f"Schema cache hit for header {signature[:8]}")
+            schema = {
+                "columns": columns,
+                "types": dict(cached["types"]),
+                "primary_key": cached["primary_key"],
+            }
+            if return_df:
+                schema["df"] = df
+            return schema
+
+        # Scan each column once; type inference and primary-key
+        # detection both read from the shared stats
+        stats = analyze_columns(df, sample_size=sample_rows)
+
         # Infer column types
-        types = infer_column_types(df)
+        types = infer_column_types(df, sample_size=sample_rows, stats=stats)
         logger.debug(f"Inferred types: {types}")
 
         # Detect primary key
-        primary_key = detect_primary_key(df, columns)
+        primary_key = detect_primary_key(df, columns, stats=stats)
         logger.info(
             f"Schema detected: {len(columns)} columns, PK: {primary_key}"
         )
 
-        return {
+        _store_schema_cache(signature, types, primary_key)
+
+        schema = {
             "columns": columns,
             "types": types,
             "primary_key": primary_key,
         }
+        if return_df:
+            schema["df"] = df
+        return schema
 
+    except SchemaDetectionError:
+        raise
     except pd.errors.EmptyDataError:
         error_msg = "Excel file is empty"
         logger.error(error_msg)
@@ -84,6 +352,67 @@ def detect_schema(file_path: str) -> Dict[str, Any]:
         raise SchemaDetectionError(error_msg)
 
 
+def detect_schemas_batch(paths: List[str]) -> List[Dict[str, Any]]:
+    """
+    Detect schemas for several Excel files concurrently.
+
+    Workbook reading is I/O and decompression bound, so files are
+    processed in a thread pool. Each file goes through
+    detect_schema_cached, so repeated paths and previously-seen header
+    rows skip redundant parsing and inference.
+
+    Args:
+        paths: Paths to the Excel files.
+
+    Returns:
+        List of schema dictionaries in the same order as paths.
+
+    Raises:
+        SchemaDetectionError: If any file cannot be read or has no data.
+    """
+    if not paths:
+        return []
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+        return list(executor.map(detect_schema_cached, paths))
+
+
+@functools.lru_cache(maxsize=32)
+def _detect_schema_for_file(
+    file_path: str, mtime: float, size: int
+) -> Dict[str, Any]:
+    """Run detect_schema for a file, memoized on (path, mtime, size)."""
+    return detect_schema(file_path)
+
+
+def detect_schema_cached(file_path: str) -> Dict[str, Any]:
+    """
+    Detect schema from an Excel file, skipping the parse on repeat calls.
+
+    Results are memoized on the file's path, modification time and
+    size, so re-detecting an unchanged file is free. A copy of the
+    cached schema is returned so callers can mutate it safely.
+
+    Args:
+        file_path: Path to the Excel file.
+
+    Returns:
+        Schema dictionary as returned by detect_schema.
+
+    Raises:
+        SchemaDetectionError: If file cannot be read or has no data.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError as e:
+        raise SchemaDetectionError(f"Cannot stat file: {e}")
+    cached = _detect_schema_for_file(str(file_path), stat.st_mtime, stat.st_size)
+    return {
+        "columns": list(cached["columns"]),
+        "types": dict(cached["types"]),
+        "primary_key": cached["primary_key"],
+    }
+
+
 def clean_column_name(name: str) -> str:
     """
     Clean column name for SQL compatibility.
@@ -94,91 +423,323 @@ def clean_column_name(name: str) -> str:
     Returns:
         Cleaned column name safe for SQL.
     """
-    # Replace spaces and special characters with underscores
-    cleaned = str(name).strip().replace(" ", "_")
-    # Remove invalid SQL characters
-    cleaned = "".join(c if c.isalnum() or c == "_" else "_" for c in cleaned)
+    # Map spaces and common punctuation to underscores in a single
+    # translate() pass, then sweep anything still invalid with the
+    # compiled character class; both run in C
+    cleaned = str(name).strip().translate(_NAME_TRANS)
+    if _INVALID_CHARS.search(cleaned):
+        cleaned = _INVALID_CHARS.sub("_", cleaned)
     # Ensure it doesn't start with a number
     if cleaned and cleaned[0].isdigit():
         cleaned = f"col_{cleaned}"
     # Ensure it's not empty
     if not cleaned:
         cleaned = "Column_A"
-    return cleaned
+    # Interned names are shared across schema dicts and DataFrame
+    # columns, cutting allocations and speeding dict lookups on wide
+    # sheets
+    return sys.intern(cleaned)
+
+
+def optimize_dtypes(df: pd.DataFrame, types: Dict[str, str]) -> pd.DataFrame:
+    """
+    Downcast numeric columns to the smallest dtype that holds them.
+
+    Inference leaves integers as int64 and floats as float64; shrinking
+    them cuts the working set and the bytes moved into insert_data.
+    Columns that fail to convert are left untouched.
+
+    Args:
+        df: DataFrame to downcast in place.
+        types: Detected types from infer_column_types.
+
+    Returns:
+        The same DataFrame with numeric columns downcast.
+    """
+    for col, col_type in types.items():
+        if col not in df.columns:
+            continue
+        try:
+            if col_type == "int":
+                df[col] = pd.to_numeric(df[col], downcast="integer")
+            elif col_type == "float":
+                df[col] = pd.to_numeric(df[col], downcast="float")
+        except (ValueError, TypeError):
+            logger.debug(f"Could not downcast column '{col}', leaving as-is")
+    return df
 
 
-def infer_column_types(df: pd.DataFrame) -> Dict[str, str]:
+def _count_unique(arr: np.ndarray) -> int:
+    """
+    Count distinct values in an array with a dtype-appropriate kernel.
+
+    Numeric and datetime arrays go through np.unique, which sorts
+    unboxed native values; everything else uses pandas' klib hashtable.
+    Either way the count runs outside the interpreter.
+
+    Args:
+        arr: Array of non-null values.
+
+    Returns:
+        Number of distinct values.
+    """
+    if arr.dtype.kind in "iufM":
+        return np.unique(arr).size
+    return pd.unique(arr).size
+
+
+def analyze_columns(
+    df: pd.DataFrame, sample_size: int = 10_000
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Compute per-column stats in a single pass over the DataFrame.
+
+    Type inference and primary-key detection both need the same
+    sample, non-null values and uniqueness counts; computing them once
+    here avoids each function re-scanning every column.
+
+    Args:
+        df: DataFrame to analyze.
+        sample_size: Number of leading rows to inspect per column.
+
+    Returns:
+        Dictionary mapping column names to stats dictionaries with keys
+        'sample', 'non_null', 'all_null', 'dtype' and 'n_unique_sample'.
+    """
+    stats = {}
+    for col in df.columns:
+        sample = df[col].head(sample_size)
+        non_null = sample.dropna()
+        stats[col] = {
+            "sample": sample,
+            "non_null": non_null,
+            "all_null": len(non_null) == 0,
+            "dtype": sample.dtype,
+            "n_unique_sample": _count_unique(non_null.head(256).to_numpy()),
+        }
+    return stats
+
+
+def infer_column_types(
+    df: pd.DataFrame,
+    sample_size: int = 10_000,
+    stats: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Dict[str, str]:
     """
     Infer column types from DataFrame.
 
+    Types are inferred from the first sample_size rows of each column
+    rather than scanning every value.
+
     Args:
         df: DataFrame to analyze.
+        sample_size: Number of leading rows to inspect per column.
+        stats: Optional precomputed stats from analyze_columns.
 
     Returns:
         Dictionary mapping column names to types (int, float, str, date).
     """
+    if stats is None:
+        stats = analyze_columns(df, sample_size=sample_size)
+
     types = {}
 
     for col in df.columns:
+        col_stats = stats[col]
+
         # Skip null-only columns
-        if df[col].isna().all():
-            types[col] = "str"
+        if col_stats["all_null"]:
+            types[col] = _TYPE_STR
             logger.debug(f"Column '{col}' is all null, defaulting to str")
             continue
 
-        # Check for date/datetime
-        if pd.api.types.is_datetime64_any_dtype(df[col]):
-            types[col] = "date"
-            continue
+        # Dispatch on the dtype kind character, which is a single
+        # attribute lookup instead of a pandas API call per candidate
+        # type; only object columns need a value-level date check
+        kind = col_stats["dtype"].kind
+        if kind == "M":
+            types[col] = _TYPE_DATE
+        elif kind in "iu":
+            types[col] = _TYPE_INT
+        elif kind == "f":
+            types[col] = _TYPE_FLOAT
+        else:
+            types[col] = _infer_object_type(col_stats["non_null"])
 
-        # Try to infer from non-null values
-        non_null = df[col].dropna()
+    return types
 
-        if len(non_null) == 0:
-            types[col] = "str"
-            continue
 
-        # Check if all values are integers
-        if pd.api.types.is_integer_dtype(non_null):
-            types[col] = "int"
-        # Check if all values are floats
-        elif pd.api.types.is_float_dtype(non_null):
-            types[col] = "float"
-        # Check if can be converted to date
-        elif is_date_column(non_null):
-            types[col] = "date"
-        # Default to string
-        else:
-            types[col] = "str"
+# Canonical type-name singletons; every schema shares these four
+# interned strings instead of allocating fresh literals per column
+_TYPE_INT = sys.intern("int")
+_TYPE_FLOAT = sys.intern("float")
+_TYPE_DATE = sys.intern("date")
+_TYPE_STR = sys.intern("str")
+
+# Promotion lattice for object-column inference: each value can only
+# move the column's type upward, and reaching str stops the scan
+_LATTICE = {_TYPE_INT: 0, _TYPE_FLOAT: 1, _TYPE_DATE: 2, _TYPE_STR: 3}
 
-    return types
+
+def _infer_object_type(non_null: pd.Series) -> str:
+    """
+    Infer an object column's type in a single pass over its sample.
+
+    Each value promotes the running type up the int → float → date →
+    str lattice; the scan stops as soon as str is reached, so typical
+    text columns exit on their first value.
+
+    Args:
+        non_null: Non-null sample values of an object-dtype column.
+
+    Returns:
+        One of 'int', 'float', 'date', 'str'.
+    """
+    t = _TYPE_INT
+    date_fmt = None
+    for value in non_null:
+        if isinstance(value, bool):
+            v = _TYPE_STR
+        elif isinstance(value, (int, np.integer)):
+            v = _TYPE_INT
+        elif isinstance(value, (float, np.floating)):
+            v = _TYPE_FLOAT
+        else:
+            s = str(value)
+            v = _TYPE_STR
+            # Only promote strings that round-trip exactly: zero-padded
+            # identifiers like "007" parse as int but must stay TEXT
+            try:
+                if str(int(s)) == s:
+                    v = _TYPE_INT
+            except ValueError:
+                try:
+                    if str(float(s)) == s:
+                        v = _TYPE_FLOAT
+                except ValueError:
+                    if _DATE_SHAPE.match(s):
+                        if date_fmt is None:
+                            date_fmt = pd.tseries.api.guess_datetime_format(s)
+                        if date_fmt is not None:
+                            try:
+                                pd.to_datetime(s, format=date_fmt)
+                                v = _TYPE_DATE
+                            except (ValueError, TypeError):
+                                pass
+        if _LATTICE[v] > _LATTICE[t]:
+            t = v
+        if t is _TYPE_STR:
+            break
+    return t
 
 
 def is_date_column(series: pd.Series) -> bool:
     """
     Check if a series contains date-like values.
 
+    Guesses a datetime format from the first non-null value, then
+    verifies it against a small sample with an explicit format= —
+    much cheaper than letting pandas infer the format per value.
+
     Args:
         series: Series to check.
 
     Returns:
         True if series appears to contain dates.
     """
-    # Try to convert to datetime
+    # Numeric columns are never treated as dates, and datetime columns
+    # already are; neither needs format guessing
+    kind = series.dtype.kind
+    if kind in "iuf":
+        return False
+    if kind == "M":
+        return True
+
+    non_null = series.dropna()
+    if len(non_null) == 0:
+        return False
+
+    # Cheap shape check before the format machinery: pure-string
+    # columns rarely start digit-separator and bail out here
+    if not _DATE_SHAPE.match(str(non_null.iloc[0])):
+        return False
+
     try:
-        pd.to_datetime(series, errors="raise")
+        fmt = pd.tseries.api.guess_datetime_format(str(non_null.iloc[0]))
+        if fmt is None:
+            return False
+        pd.to_datetime(non_null.head(50), format=fmt, errors="raise")
         return True
     except (ValueError, TypeError):
         return False
 
 
-def detect_primary_key(df: pd.DataFrame, columns: List[str]) -> str:
+def _is_unique_column(
+    series: pd.Series, col_stats: Optional[Dict[str, Any]] = None
+) -> bool:
+    """
+    Check whether a column's non-null values are all unique.
+
+    Cheap pre-filters run before the full nunique(): a duplicate within
+    a small leading sample rules the column out immediately, and
+    strictly monotonic integer columns (typical id columns) are
+    accepted without hashing every value.
+
+    Args:
+        series: Series to check.
+        col_stats: Optional precomputed stats from analyze_columns.
+
+    Returns:
+        True if all non-null values are unique.
+    """
+    if col_stats is not None:
+        non_null = col_stats["non_null"]
+        sample_nunique = col_stats["n_unique_sample"]
+    else:
+        non_null = series.dropna()
+        sample_nunique = None
+
+    total_count = len(non_null)
+    if total_count == 0:
+        return False
+
+    # A duplicate in the first 256 values rules the column out cheaply
+    sample = non_null.head(256)
+    if sample_nunique is None:
+        sample_nunique = _count_unique(sample.to_numpy())
+    if sample_nunique != len(sample):
+        return False
+
+    if total_count <= 256:
+        # The sample covered the whole column
+        return True
+
+    arr = non_null.to_numpy()
+
+    # Strictly monotonic integers are unique by definition; a vectorized
+    # neighbour comparison is far cheaper than building a hash set
+    if pd.api.types.is_integer_dtype(non_null):
+        diffs = arr[1:] - arr[:-1]
+        if (diffs > 0).all() or (diffs < 0).all():
+            return True
+
+    # Dtype-dispatched kernel: native sort for numeric arrays, klib
+    # hashtable for everything else
+    return _count_unique(arr) == total_count
+
+
+def detect_primary_key(
+    df: pd.DataFrame,
+    columns: List[str],
+    stats: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> str:
     """
     Detect primary key column or generate one.
 
     Args:
         df: DataFrame to analyze.
         columns: List of column names.
+        stats: Optional precomputed stats from analyze_columns.
 
     Returns:
         Name of primary key column.
@@ -187,26 +748,22 @@ def detect_primary_key(df: pd.DataFrame, columns: List[str]) -> str:
         logger.warning("No columns found, generating 'id' as primary key")
         return "id"
 
+    if stats is None:
+        stats = {}
+
     # Check if first column is unique
     first_col = columns[0]
-    if df[first_col].notna().any():
-        unique_count = df[first_col].nunique()
-        total_count = len(df[first_col].dropna())
-
-        if unique_count == total_count and total_count > 0:
-            logger.info(f"Using '{first_col}' as primary key (unique column)")
-            return first_col
+    if _is_unique_column(df[first_col], stats.get(first_col)):
+        logger.info(f"Using '{first_col}' as primary key (unique column)")
+        return first_col
 
     # Check other columns for uniqueness
     for col in columns:
         if col == first_col:
             continue
-        if df[col].notna().any():
-            unique_count = df[col].nunique()
-            total_count = len(df[col].dropna())
-            if unique_count == total_count and total_count > 0:
-                logger.info(f"Using '{col}' as primary key (unique column)")
-                return col
+        if _is_unique_column(df[col], stats.get(col)):
+            logger.info(f"Using '{col}' as primary key (unique column)")
+            return col
 
     # No unique column found, generate id
     logger.warning("No unique column found, will auto-generate 'id' as primary key")
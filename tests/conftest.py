@@ -0,0 +1,41 @@
+"""Shared pytest fixtures."""
+
+import runpy
+from pathlib import Path
+
+import pytest
+
+import src.schema_detector as schema_detector
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+_FIXTURE_FILES = (
+    "sample_data.xlsx",
+    "sample_empty.xlsx",
+    "sample_no_headers.xlsx",
+    "sample_no_pk.xlsx",
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def generated_fixtures():
+    """Build the Excel fixture files if any are missing.
+
+    The binaries are gitignored, so a fresh clone has none; they are
+    regenerated from tests/create_fixtures.py, which runs its writes at
+    module level.
+    """
+    if not all((FIXTURES_DIR / name).exists() for name in _FIXTURE_FILES):
+        runpy.run_path(str(Path(__file__).parent / "create_fixtures.py"))
+
+
+@pytest.fixture(autouse=True)
+def isolated_schema_cache(tmp_path, monkeypatch):
+    """Point the persisted schema cache at a per-test temp file.
+
+    Keeps test runs from reading or polluting the developer's real
+    ~/.cache/excel-to-streamlit/schemas.json.
+    """
+    monkeypatch.setattr(
+        schema_detector, "_SCHEMA_CACHE_PATH", tmp_path / "schemas.json"
+    )
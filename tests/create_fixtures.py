@@ -27,11 +27,11 @@ df_no_headers.to_excel(
     engine="openpyxl",
 )
 
-# Sample data without unique primary key
+# Sample data without unique primary key (every column has duplicates)
 sample_no_pk = {
     "category": ["A", "A", "B", "B", "C"],
-    "value": [10, 20, 30, 40, 50],
-    "description": ["Item 1", "Item 2", "Item 3", "Item 4", "Item 5"],
+    "value": [10, 20, 20, 40, 10],
+    "description": ["Item 1", "Item 2", "Item 1", "Item 2", "Item 1"],
 }
 
 df_no_pk = pd.DataFrame(sample_no_pk)
@@ -1,5 +1,6 @@
 """Unit tests for main Streamlit app."""
 
+import io
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
@@ -11,6 +12,15 @@ from app import validate_file, process_excel_file
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
+class FakeUpload(io.BytesIO):
+    """File-like stand-in for a Streamlit uploaded file."""
+
+    def __init__(self, data: bytes = b"fake excel data", name: str = "test.xlsx"):
+        super().__init__(data)
+        self.name = name
+        self.size = len(data)
+
+
 class TestFileValidation:
     """Test file validation functionality."""
 
@@ -54,23 +64,10 @@ class TestFileValidation:
 class TestProcessExcelFile:
     """Test Excel file processing."""
 
-    @patch('app.tempfile.NamedTemporaryFile')
     @patch('app.detect_schema')
-    @patch('app.pd.read_excel')
-    @patch('app.DatabaseManager')
-    def test_process_excel_file_success(self, mock_db, mock_read_excel, mock_detect, mock_tempfile):
+    @patch('app.read_excel_sheet')
+    def test_process_excel_file_success(self, mock_read_excel, mock_detect):
         """Test successful file processing."""
-        # Setup mocks
-        mock_file = Mock()
-        mock_file.name = "test.xlsx"
-        mock_file.getvalue.return_value = b"fake excel data"
-
-        mock_temp = Mock()
-        mock_temp.__enter__.return_value = mock_temp
-        mock_temp.__exit__.return_value = None
-        mock_temp.name = "/tmp/test.xlsx"
-        mock_tempfile.return_value = mock_temp
-
         mock_detect.return_value = {
             "columns": ["id", "name"],
             "types": {"id": "int", "name": "str"},
@@ -80,37 +77,29 @@ class TestProcessExcelFile:
         mock_df = pd.DataFrame({"id": [1, 2], "name": ["Alice", "Bob"]})
         mock_read_excel.return_value = mock_df
 
-        mock_db_instance = Mock()
-        mock_db.return_value = mock_db_instance
+        db_manager = Mock()
 
-        schema, error = process_excel_file(mock_file)
+        schema, row_count, error = process_excel_file(FakeUpload(), db_manager)
 
         assert schema is not None
+        assert row_count == 2
         assert error is None
         assert mock_detect.called
-        assert mock_db_instance.create_table.called
-        assert mock_db_instance.insert_data.called
+        assert db_manager.create_table.called
+        assert db_manager.insert_data.called
 
-    @patch('app.tempfile.NamedTemporaryFile')
     @patch('app.detect_schema')
-    def test_process_excel_file_schema_error(self, mock_detect, mock_tempfile):
+    @patch('app.read_excel_sheet')
+    def test_process_excel_file_schema_error(self, mock_read_excel, mock_detect):
         """Test file processing with schema detection error."""
         from src.schema_detector import SchemaDetectionError
 
-        mock_file = Mock()
-        mock_file.name = "test.xlsx"
-        mock_file.getvalue.return_value = b"fake excel data"
-
-        mock_temp = Mock()
-        mock_temp.__enter__.return_value = mock_temp
-        mock_temp.__exit__.return_value = None
-        mock_temp.name = "/tmp/test.xlsx"
-        mock_tempfile.return_value = mock_temp
-
+        mock_read_excel.return_value = pd.DataFrame({"id": [1]})
         mock_detect.side_effect = SchemaDetectionError("Test error")
 
-        schema, error = process_excel_file(mock_file)
+        schema, row_count, error = process_excel_file(FakeUpload(), Mock())
 
         assert schema is None
+        assert row_count == 0
         assert error is not None
         assert "test error" in error.lower()
@@ -74,14 +74,16 @@ class TestEditForm:
             "types": {"id": "int", "name": "str"},
             "primary_key": "id",
         }
-        df = pd.DataFrame({"id": [1, 2], "name": ["Alice", "Bob"]})
         db_manager = Mock()
+        db_manager.list_ids.return_value = [1, 2]
+        db_manager.get_record.return_value = {"id": 1, "name": "Alice"}
 
-        # Mock selectbox
-        mock_st.selectbox.return_value = "1"
+        # Mock selectbox (returns the selected position)
+        mock_st.selectbox.return_value = 0
 
-        generate_edit_form(schema, df, db_manager, "id")
+        generate_edit_form(schema, db_manager, "id")
         # Should not raise exception
+        db_manager.get_record.assert_called_once_with("id", 1)
 
 
 class TestDeleteInterface:
@@ -90,21 +92,21 @@ class TestDeleteInterface:
     @patch('src.crud_generator.st')
     def test_generate_delete_interface(self, mock_st):
         """Test delete interface generation."""
-        df = pd.DataFrame({"id": [1, 2], "name": ["Alice", "Bob"]})
         db_manager = Mock()
+        db_manager.list_ids.return_value = [1, 2]
 
         # Mock selectbox and button
-        mock_st.selectbox.return_value = "1"
+        mock_st.selectbox.return_value = 0
         mock_st.button.return_value = False
 
-        generate_delete_interface(df, db_manager, "id")
+        generate_delete_interface(db_manager, "id")
         # Should not raise exception
 
     @patch('src.crud_generator.st')
     def test_generate_delete_interface_empty(self, mock_st):
         """Test delete interface with empty data."""
-        df = pd.DataFrame()
         db_manager = Mock()
+        db_manager.list_ids.return_value = []
 
-        generate_delete_interface(df, db_manager, "id")
+        generate_delete_interface(db_manager, "id")
         mock_st.info.assert_called_once()
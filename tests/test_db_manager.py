@@ -147,6 +147,59 @@ class TestDatabaseManager:
         assert len(df) == 1
         assert df["name"].iloc[0] == "Bob"
 
+    def test_count(self):
+        """Test counting records."""
+        schema = {
+            "columns": ["id", "name"],
+            "types": {"id": "int", "name": "str"},
+            "primary_key": "id",
+        }
+        self.db_manager.create_table(schema)
+
+        assert self.db_manager.count() == 0
+        self.db_manager.create_record({"id": 1, "name": "Alice"})
+        self.db_manager.create_record({"id": 2, "name": "Bob"})
+        assert self.db_manager.count() == 2
+
+    def test_list_ids(self):
+        """Test listing primary key values."""
+        schema = {
+            "columns": ["id", "name"],
+            "types": {"id": "int", "name": "str"},
+            "primary_key": "id",
+        }
+        self.db_manager.create_table(schema)
+
+        self.db_manager.create_record({"id": 1, "name": "Alice"})
+        self.db_manager.create_record({"id": 2, "name": "Bob"})
+
+        assert self.db_manager.list_ids("id") == [1, 2]
+
+    def test_get_record(self):
+        """Test reading a single record by primary key."""
+        schema = {
+            "columns": ["id", "name"],
+            "types": {"id": "int", "name": "str"},
+            "primary_key": "id",
+        }
+        self.db_manager.create_table(schema)
+
+        self.db_manager.create_record({"id": 1, "name": "Alice"})
+
+        record = self.db_manager.get_record("id", 1)
+        assert record == {"id": 1, "name": "Alice"}
+
+    def test_get_record_missing(self):
+        """Test reading a record that does not exist."""
+        schema = {
+            "columns": ["id", "name"],
+            "types": {"id": "int", "name": "str"},
+            "primary_key": "id",
+        }
+        self.db_manager.create_table(schema)
+
+        assert self.db_manager.get_record("id", 99) is None
+
     def test_connection_context_manager(self):
         """Test connection context manager."""
         with self.db_manager.get_connection() as conn:
@@ -1,14 +1,19 @@
 """Unit tests for schema_detector module."""
 
+import os
+
 import pytest
 import pandas as pd
 from pathlib import Path
 from src.schema_detector import (
     detect_schema,
+    detect_schema_cached,
+    detect_schemas_batch,
     clean_column_name,
     infer_column_types,
     is_date_column,
     detect_primary_key,
+    optimize_dtypes,
     SchemaDetectionError,
 )
 
@@ -56,6 +61,40 @@ class TestSchemaDetection:
         with pytest.raises(SchemaDetectionError):
             detect_schema("nonexistent.xlsx")
 
+    def test_detect_schema_cache_revalidates_pk(self, tmp_path):
+        """A cached PK from a same-header file must not survive duplicate data."""
+        file_a = tmp_path / "a.xlsx"
+        file_b = tmp_path / "b.xlsx"
+        pd.DataFrame({
+            "cat": ["x", "x", "y"],
+            "val": [1, 2, 3],
+        }).to_excel(file_a, index=False, engine="openpyxl")
+        pd.DataFrame({
+            "cat": ["x", "x", "y"],
+            "val": [1, 1, 1],
+        }).to_excel(file_b, index=False, engine="openpyxl")
+
+        assert detect_schema(str(file_a))["primary_key"] == "val"
+        # Same headers, but 'val' is no longer unique here
+        assert detect_schema(str(file_b))["primary_key"] != "val"
+
+    def test_detect_schema_cache_revalidates_types(self, tmp_path):
+        """Cached types from a same-header file must not survive a dtype change."""
+        file_a = tmp_path / "a.xlsx"
+        file_b = tmp_path / "b.xlsx"
+        pd.DataFrame({
+            "cat": ["x", "x", "y"],
+            "val": [1, 2, 3],
+        }).to_excel(file_a, index=False, engine="openpyxl")
+        pd.DataFrame({
+            "cat": ["x", "x", "y"],
+            "val": ["abc", "def", "ghi"],
+        }).to_excel(file_b, index=False, engine="openpyxl")
+
+        assert detect_schema(str(file_a))["types"]["val"] == "int"
+        # Same headers, but 'val' holds strings here
+        assert detect_schema(str(file_b))["types"]["val"] == "str"
+
 
 class TestColumnNameCleaning:
     """Test column name cleaning functionality."""
@@ -94,6 +133,15 @@ class TestTypeInference:
         assert types["str_col"] == "str"
         assert types["date_col"] == "date"
 
+    def test_infer_column_types_zero_padded(self):
+        """Zero-padded identifier strings must stay str, not become int."""
+        df = pd.DataFrame({
+            "code": ["007", "008", "0099"],
+        })
+
+        types = infer_column_types(df)
+        assert types["code"] == "str"
+
     def test_infer_column_types_mixed(self):
         """Test type inference with mixed types (should default to str)."""
         df = pd.DataFrame({
@@ -118,6 +166,98 @@ class TestDateDetection:
         assert is_date_column(series) is False
 
 
+class TestSchemaCaching:
+    """Test memoized and batch schema detection."""
+
+    def test_detect_schema_cached_invalidates_on_change(self, tmp_path):
+        """Rewriting a file must invalidate its memoized schema."""
+        file_path = tmp_path / "data.xlsx"
+        pd.DataFrame({
+            "id": [1, 2, 3],
+            "name": ["A", "B", "C"],
+        }).to_excel(file_path, index=False, engine="openpyxl")
+
+        schema = detect_schema_cached(str(file_path))
+        assert schema["columns"] == ["id", "name"]
+
+        # Same path, different contents (mtime/size change)
+        pd.DataFrame({
+            "code": [1, 2, 3, 4],
+            "label": ["A", "B", "C", "D"],
+            "extra": [0.5, 1.5, 2.5, 3.5],
+        }).to_excel(file_path, index=False, engine="openpyxl")
+        os.utime(file_path)
+
+        schema = detect_schema_cached(str(file_path))
+        assert schema["columns"] == ["code", "label", "extra"]
+
+    def test_detect_schema_cached_returns_copy(self, tmp_path):
+        """Mutating a returned schema must not corrupt the cache."""
+        file_path = tmp_path / "data.xlsx"
+        pd.DataFrame({
+            "id": [1, 2],
+            "name": ["A", "B"],
+        }).to_excel(file_path, index=False, engine="openpyxl")
+
+        first = detect_schema_cached(str(file_path))
+        first["types"]["name"] = "int"
+
+        second = detect_schema_cached(str(file_path))
+        assert second["types"]["name"] == "str"
+
+    def test_detect_schemas_batch_preserves_order(self):
+        """Batch detection returns schemas in input order."""
+        paths = [
+            str(FIXTURES_DIR / "sample_no_pk.xlsx"),
+            str(FIXTURES_DIR / "sample_data.xlsx"),
+        ]
+        schemas = detect_schemas_batch(paths)
+
+        assert len(schemas) == 2
+        assert schemas[0]["columns"] == ["category", "value", "description"]
+        assert schemas[1]["primary_key"] == "id"
+
+    def test_detect_schemas_batch_empty(self):
+        """Batch detection of no paths returns an empty list."""
+        assert detect_schemas_batch([]) == []
+
+    def test_detect_schemas_batch_propagates_errors(self):
+        """A bad file in the batch raises SchemaDetectionError."""
+        paths = [
+            str(FIXTURES_DIR / "sample_data.xlsx"),
+            "nonexistent.xlsx",
+        ]
+        with pytest.raises(SchemaDetectionError):
+            detect_schemas_batch(paths)
+
+
+class TestDtypeOptimization:
+    """Test numeric downcasting."""
+
+    def test_optimize_dtypes_downcasts(self):
+        """Int and float columns shrink to smaller dtypes."""
+        df = pd.DataFrame({
+            "id": [1, 2, 3],
+            "score": [1.5, 2.5, 3.5],
+            "name": ["A", "B", "C"],
+        })
+        types = {"id": "int", "score": "float", "name": "str"}
+
+        df = optimize_dtypes(df, types)
+        assert df["id"].dtype.itemsize < 8
+        assert df["score"].dtype.itemsize < 8
+        assert df["name"].dtype == object
+
+    def test_optimize_dtypes_keeps_unconvertible(self):
+        """Columns that fail to convert are left untouched."""
+        df = pd.DataFrame({
+            "code": ["a", "b", "c"],
+        })
+
+        df = optimize_dtypes(df, {"code": "int"})
+        assert list(df["code"]) == ["a", "b", "c"]
+
+
 class TestPrimaryKeyDetection:
     """Test primary key detection."""
 
@@ -143,7 +283,7 @@ class TestPrimaryKeyDetection:
         """Test primary key detection with no unique column."""
         df = pd.DataFrame({
             "category": ["A", "A", "B"],
-            "value": [1, 2, 3],
+            "value": [1, 2, 1],
         })
         pk = detect_primary_key(df, ["category", "value"])
         assert pk == "id"  # Should auto-generate